@@ -57,7 +57,7 @@ def run_application(cli_args: list[str] = None, /) -> None:  # pragma: no cover
 
     logger.info("Mapping database schema.")
     db_conn = create_db_engine(db_url, **db_kwargs)
-    db_meta = create_db_metadata(db_conn)
+    db_meta = create_db_metadata(db_conn, args.db_tables, args.schema_cache, args.schema_cache_ttl)
 
     logger.info("Creating application.")
     app = create_app(args.app_title, args.app_version)
@@ -28,18 +28,9 @@ __all__ = ["create_app", "run_server"]
 logger = logging.getLogger("auto_rest.access")
 
 
-async def logging_middleware(request: Request, call_next: callable) -> Response:
-    """FastAPI middleware for logging response status codes.
-
-    Args:
-        request: The incoming HTTP request.
-        call_next: The next middleware in the middleware chain.
+def _request_meta(request: Request) -> dict[str, str | int]:
+    """Extract request metadata for inclusion in access log records."""
 
-    Returns:
-        The outgoing HTTP response.
-    """
-
-    # Extract metadata from the request
     request_meta = {
         "ip": request.client.host,
         "port": request.client.port,
@@ -50,18 +41,35 @@ async def logging_middleware(request: Request, call_next: callable) -> Response:
     if request.url.query:
         request_meta["endpoint"] += "?" + request.url.query
 
+    return request_meta
+
+
+async def logging_middleware(request: Request, call_next: callable) -> Response:
+    """FastAPI middleware for logging response status codes.
+
+    Request metadata is only extracted when the corresponding log level is enabled.
+
+    Args:
+        request: The incoming HTTP request.
+        call_next: The next middleware in the middleware chain.
+
+    Returns:
+        The outgoing HTTP response.
+    """
+
     # Execute handling logic
     try:
         response = await call_next(request)
 
     except Exception as exc:
-        logger.error(str(exc), exc_info=exc, extra=request_meta)
+        logger.error(str(exc), exc_info=exc, extra=_request_meta(request))
         raise
 
     # Log the outgoing response
-    status = HTTPStatus(response.status_code)
-    level = logging.INFO if status < 400 else logging.ERROR
-    logger.log(level, f"{status} {status.phrase}", extra=request_meta)
+    level = logging.INFO if response.status_code < 400 else logging.ERROR
+    if logger.isEnabledFor(level):
+        status = HTTPStatus(response.status_code)
+        logger.log(level, f"{status} {status.phrase}", extra=_request_meta(request))
 
     return response
 
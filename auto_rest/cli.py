@@ -151,6 +151,9 @@ def create_cli_parser(exit_on_error: bool = True) -> ArgumentParser:
     database.add_argument("--db-user", help="username to authenticate with.")
     database.add_argument("--db-pass", help="password to authenticate with.")
     database.add_argument("--db-config", action="store", type=Path, help="path to a database configuration file.")
+    database.add_argument("--db-tables", nargs="+", metavar="TABLE", help="only map the given database tables.")
+    database.add_argument("--schema-cache", type=Path, metavar="DIR", help="directory used to cache the mapped database schema.")
+    database.add_argument("--schema-cache-ttl", type=float, metavar="SECONDS", help="refresh cached schemas older than the given age.")
 
     server = parser.add_argument_group(title="server settings")
     server.add_argument("--server-host", default="127.0.0.1", help="API server host address.")
@@ -48,14 +48,29 @@ This makes it easy to incorporate handlers into a FastAPI application.
     FastAPI internally performs post-processing on values returned by endpoint
     handlers before sending them in an HTTP response. For this reason, handlers
     should always be tested within the context of a FastAPI application.
+
+    Handlers declare their return types so FastAPI can validate and serialize
+    responses directly to JSON bytes using Pydantic. Registering handlers with
+    a custom response class (e.g., `ORJSONResponse`) disables this behavior
+    and results in slower serialization.
+
+    Handler factories for database tables are cached, and repeated calls
+    with the same engine and table return the same handler function. Cached
+    handlers keep their engine and table alive for the life of the process.
+    Applications that dispose of engines (e.g., when rebuilding an app) can
+    release them by calling `cache_clear()` on each factory, along with
+    `create_interface.cache_clear()` and `create_session_iterator.cache_clear()`.
 """
 
-from typing import Awaitable, Callable, Literal, Optional
+from functools import lru_cache
+from hashlib import blake2b
+from typing import AsyncGenerator, Awaitable, Callable, Literal, Optional
 
-from fastapi import Depends, Query, Response
+from fastapi import Depends, Header, Query, Response
+from fastapi.responses import StreamingResponse
 from pydantic import create_model
 from pydantic.main import BaseModel as PydanticModel
-from sqlalchemy import asc, desc, func, insert, MetaData, select, Table
+from sqlalchemy import asc, bindparam, Column, ColumnElement, delete, desc, insert, MetaData, select, Table, update
 
 from .interfaces import *
 from .models import *
@@ -74,6 +89,27 @@ __all__ = [
     "create_welcome_handler",
 ]
 
+# Upper bounds on list pagination, protecting the database from unbounded scans
+MAX_PAGE_SIZE = 1000
+MAX_PAGE_OFFSET = 10_000
+
+# Media type for streaming list results as newline delimited JSON
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+@lru_cache(maxsize=None)
+def _interface_columns(table: Table) -> tuple[Column, ...]:
+    """Return table columns in the same order as the fields of the table's Pydantic interface."""
+
+    return tuple(table.c[name] for name in create_interface(table).model_fields)
+
+
+@lru_cache(maxsize=None)
+def _pk_clauses(table: Table) -> tuple[ColumnElement[bool], ...]:
+    """Return `WHERE` clauses matching each primary key column to a bound parameter of the same name."""
+
+    return tuple(column == bindparam(column.name) for column in table.primary_key.columns)
+
 
 def create_welcome_handler() -> Callable[[], Awaitable[PydanticModel]]:
     """Create an endpoint handler that returns an application welcome message.
@@ -83,11 +119,12 @@ def create_welcome_handler() -> Callable[[], Awaitable[PydanticModel]]:
     """
 
     interface = create_model("Welcome", message=(str, "Welcome to Auto-Rest!"))
+    content = interface().model_dump_json().encode()
 
     async def welcome_handler() -> interface:
         """Return an application welcome message."""
 
-        return interface()
+        return Response(content=content, media_type="application/json")
 
     return welcome_handler
 
@@ -104,11 +141,12 @@ def create_about_handler(name: str, version: str) -> Callable[[], Awaitable[Pyda
     """
 
     interface = create_model("Version", version=(str, version), name=(str, name))
+    content = interface().model_dump_json().encode()
 
     async def about_handler() -> interface:
         """Return the application name and version number."""
 
-        return interface()
+        return Response(content=content, media_type="application/json")
 
     return about_handler
 
@@ -129,10 +167,13 @@ def create_engine_handler(engine: DBEngine) -> Callable[[], Awaitable[PydanticMo
         database=(str, engine.url.database),
     )
 
+    # Engine details are fixed at startup, so the response body is only encoded once
+    content = interface().model_dump_json().encode()
+
     async def meta_handler() -> interface:
         """Return metadata concerning the underlying application database."""
 
-        return interface()
+        return Response(content=content, media_type="application/json")
 
     return meta_handler
 
@@ -176,6 +217,7 @@ def create_schema_handler(metadata: MetaData) -> Callable[[], Awaitable[Pydantic
     return schema_handler
 
 
+@lru_cache(maxsize=None)
 def create_list_records_handler(engine: DBEngine, table: Table) -> Callable[..., Awaitable[list[PydanticModel]]]:
     """Create an endpoint handler that returns a list of records from a database table.
 
@@ -189,23 +231,33 @@ def create_list_records_handler(engine: DBEngine, table: Table) -> Callable[...,
 
     interface = create_interface(table)
     interface_opt = create_interface(table, mode="optional")
+    columns = _interface_columns(table)
     col_names = tuple(table.columns.keys())
 
+    # Ordering clauses are resolved once per column and direction
+    order_clauses = {
+        (name, direction): order(column)
+        for name, column in table.columns.items()
+        for direction, order in (("asc", asc), ("desc", desc))
+    }
+
     async def list_records_handler(
         response: Response,
         session: DBSession = Depends(create_session_iterator(engine)),
         filters: interface_opt = Depends(),
-        _limit_: int = Query(0, ge=0, description="The maximum number of records to return."),
-        _offset_: int = Query(0, ge=0, description="The starting index of the returned records."),
+        _limit_: int = Query(0, ge=0, description=f"The maximum number of records to return (capped at {MAX_PAGE_SIZE})."),
+        _offset_: int = Query(0, ge=0, le=MAX_PAGE_OFFSET, description="The starting index of the returned records."),
         _order_by_: Optional[Literal[*col_names]] = Query(None, description="The field name to sort by."),
         _direction_: Literal["asc", "desc"] = Query("asc", description="Sort results in 'asc' or 'desc' order."),
+        accept: str | None = Header(None),
     ) -> list[interface]:
         """Fetch a list of records from the database.
 
         URL query parameters are used to enable filtering, ordering, and paginating returned values.
+        Records are streamed as newline delimited JSON if requested via the `Accept` header.
         """
 
-        query = select(table)
+        query = select(*columns)
 
         # Fetch data per the request parameters
         for param, value in filters:
@@ -219,23 +271,31 @@ def create_list_records_handler(engine: DBEngine, table: Table) -> Callable[...,
                 else:
                     query = query.filter(column.ilike(f"%{value}%"))
 
-        if _limit_ > 0:
-            query = query.offset(_offset_).limit(_limit_)
+        # A limit of zero falls back to the maximum page size
+        _limit_ = min(_limit_, MAX_PAGE_SIZE) or MAX_PAGE_SIZE
+        query = query.offset(_offset_).limit(_limit_)
 
         if _order_by_ is not None:
-            direction = {'desc': desc, 'asc': asc}[_direction_]
-            query = query.order_by(direction(_order_by_))
+            query = query.order_by(order_clauses[_order_by_, _direction_])
 
         # Determine total record count
-        total_count_query = select(func.count()).select_from(table)
-        total_count = await execute_session_query(session, total_count_query)
+        total_count = await count_table_records(session, table)
 
         # Set headers
-        response.headers["x-pagination-limit"] = str(_limit_)
-        response.headers["x-pagination-offset"] = str(_offset_)
-        response.headers["x-pagination-total"] = str(total_count.first()[0])
-        response.headers["x-order-by"] = str(_order_by_)
-        response.headers["x-order-direction"] = str(_direction_)
+        response.headers.update({
+            "x-pagination-limit": str(_limit_),
+            "x-pagination-offset": str(_offset_),
+            "x-pagination-total": str(total_count),
+            "x-order-by": str(_order_by_),
+            "x-order-direction": str(_direction_),
+        })
+
+        if accept is not None and NDJSON_MEDIA_TYPE in accept:
+            async def iter_ndjson() -> AsyncGenerator[str, None]:
+                async for partition in stream_session_query(session, query):
+                    yield "".join(f"{interface.model_validate(row._mapping).model_dump_json()}\n" for row in partition)
+
+            return StreamingResponse(iter_ndjson(), media_type=NDJSON_MEDIA_TYPE, headers=response.headers)
 
         # noinspection PyTypeChecker
         return await execute_session_query(session, query)
@@ -243,6 +303,7 @@ def create_list_records_handler(engine: DBEngine, table: Table) -> Callable[...,
     return list_records_handler
 
 
+@lru_cache(maxsize=None)
 def create_get_record_handler(engine: DBEngine, table: Table) -> Callable[..., Awaitable[PydanticModel]]:
     """Create a function for handling GET requests against a single record in the database.
 
@@ -255,22 +316,42 @@ def create_get_record_handler(engine: DBEngine, table: Table) -> Callable[..., A
     """
 
     interface = create_interface(table)
-    pk_interface = create_interface(table, pk_only=True, mode='required')
+    pk_interface = create_interface(table, pk_only=True, mode="required")
+    columns = _interface_columns(table)
+    pk_clauses = _pk_clauses(table)
+    query = select(*columns).where(*pk_clauses)
 
     async def get_record_handler(
+        response: Response,
         pk: pk_interface = Depends(),
         session: DBSession = Depends(create_session_iterator(engine)),
+        if_none_match: str | None = Header(None),
     ) -> interface:
-        """Fetch a single record from the database."""
+        """Fetch a single record from the database.
 
-        query = select(table).filter_by(**pk.model_dump())
-        result = await execute_session_query(session, query)
+        Responds with `304 Not Modified` if the record matches an ETag from the `If-None-Match` header.
+        """
+
+        result = await execute_session_query(session, query, pk.model_dump())
         record = get_record_or_404(result)
+
+        # Weak ETag derived from the record values, since tables have no generic version column
+        opaque_tag = f'"{blake2b(repr(tuple(record)).encode(), digest_size=16).hexdigest()}"'
+        etag = f"W/{opaque_tag}"
+
+        # Weak comparison ignores the `W/` prefix, and `*` matches any existing record (RFC 9110)
+        if if_none_match is not None:
+            candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            if "*" in candidates or opaque_tag in candidates:
+                return Response(status_code=304, headers={"etag": etag})
+
+        response.headers["etag"] = etag
         return record
 
     return get_record_handler
 
 
+@lru_cache(maxsize=None)
 def create_post_record_handler(engine: DBEngine, table: Table) -> Callable[..., Awaitable[None]]:
     """Create a function for handling POST requests against a record in the database.
 
@@ -283,6 +364,7 @@ def create_post_record_handler(engine: DBEngine, table: Table) -> Callable[...,
     """
 
     interface = create_interface(table)
+    query = insert(table)
 
     async def post_record_handler(
         data: interface,
@@ -290,13 +372,14 @@ def create_post_record_handler(engine: DBEngine, table: Table) -> Callable[...,
     ) -> None:
         """Create a new record in the database."""
 
-        query = insert(table).values(**data.model_dump())
-        await execute_session_query(session, query)
+        await execute_session_query(session, query, data.model_dump())
         await commit_session(session)
+        clear_table_count(session, table)
 
     return post_record_handler
 
 
+@lru_cache(maxsize=None)
 def create_put_record_handler(engine: DBEngine, table: Table) -> Callable[..., Awaitable[PydanticModel]]:
     """Create a function for handling PUT requests against a record in the database.
 
@@ -309,8 +392,12 @@ def create_put_record_handler(engine: DBEngine, table: Table) -> Callable[..., A
     """
 
     interface = create_interface(table)
-    opt_interface = create_interface(table, mode='optional')
-    pk_interface = create_interface(table, pk_only=True, mode='required')
+    opt_interface = create_interface(table, mode="optional")
+    pk_interface = create_interface(table, pk_only=True, mode="required")
+    columns = _interface_columns(table)
+    pk_clauses = _pk_clauses(table)
+    select_query = select(*columns).where(*pk_clauses)
+    update_returning = engine.dialect.update_returning
 
     async def put_record_handler(
         data: opt_interface,
@@ -319,12 +406,18 @@ def create_put_record_handler(engine: DBEngine, table: Table) -> Callable[..., A
     ) -> interface:
         """Replace record values in the database with the provided data."""
 
-        query = select(table).filter_by(**pk.model_dump())
-        result = await execute_session_query(session, query)
-        record = get_record_or_404(result)
+        pk_values = pk.model_dump()
+        query = update(table).filter_by(**pk_values).values({**data.model_dump(), **pk_values})
+
+        # Fall back to a follow-up SELECT for databases that do not support RETURNING
+        if update_returning:
+            result = await execute_session_query(session, query.returning(*columns))
 
-        for key, value in data.model_dump().items():
-            setattr(record, key, value)
+        else:
+            get_rowcount_or_404(await execute_session_query(session, query))
+            result = await execute_session_query(session, select_query, pk_values)
+
+        record = get_record_or_404(result)
 
         await commit_session(session)
         return record
@@ -332,6 +425,7 @@ def create_put_record_handler(engine: DBEngine, table: Table) -> Callable[..., A
     return put_record_handler
 
 
+@lru_cache(maxsize=None)
 def create_patch_record_handler(engine: DBEngine, table: Table) -> Callable[..., Awaitable[PydanticModel]]:
     """Create a function for handling PATCH requests against a record in the database.
 
@@ -344,7 +438,11 @@ def create_patch_record_handler(engine: DBEngine, table: Table) -> Callable[...,
     """
 
     interface = create_interface(table)
-    pk_interface = create_interface(table, pk_only=True, mode='required')
+    pk_interface = create_interface(table, pk_only=True, mode="required")
+    columns = _interface_columns(table)
+    pk_clauses = _pk_clauses(table)
+    select_query = select(*columns).where(*pk_clauses)
+    update_returning = engine.dialect.update_returning
 
     async def patch_record_handler(
         data: interface,
@@ -353,12 +451,18 @@ def create_patch_record_handler(engine: DBEngine, table: Table) -> Callable[...,
     ) -> interface:
         """Update record values in the database with the provided data."""
 
-        query = select(table).filter_by(**pk.model_dump())
-        result = await execute_session_query(session, query)
-        record = get_record_or_404(result)
+        pk_values = pk.model_dump()
+        query = update(table).filter_by(**pk_values).values({**data.model_dump(exclude_unset=True), **pk_values})
+
+        # Fall back to a follow-up SELECT for databases that do not support RETURNING
+        if update_returning:
+            result = await execute_session_query(session, query.returning(*columns))
 
-        for key, value in data.model_dump(exclude_unset=True).items():
-            setattr(record, key, value)
+        else:
+            get_rowcount_or_404(await execute_session_query(session, query))
+            result = await execute_session_query(session, select_query, pk_values)
+
+        record = get_record_or_404(result)
 
         await commit_session(session)
         return record
@@ -366,6 +470,7 @@ def create_patch_record_handler(engine: DBEngine, table: Table) -> Callable[...,
     return patch_record_handler
 
 
+@lru_cache(maxsize=None)
 def create_delete_record_handler(engine: DBEngine, table: Table) -> Callable[..., Awaitable[None]]:
     """Create a function for handling DELETE requests against a record in the database.
 
@@ -377,7 +482,9 @@ def create_delete_record_handler(engine: DBEngine, table: Table) -> Callable[...
         An async function that handles record deletion.
     """
 
-    pk_interface = create_interface(table, pk_only=True, mode='required')
+    pk_interface = create_interface(table, pk_only=True, mode="required")
+    pk_clauses = _pk_clauses(table)
+    query = delete(table).where(*pk_clauses)
 
     async def delete_record_handler(
         pk: pk_interface = Depends(),
@@ -385,11 +492,10 @@ def create_delete_record_handler(engine: DBEngine, table: Table) -> Callable[...
     ) -> None:
         """Delete a record from the database."""
 
-        query = select(table).filter_by(**pk.model_dump())
-        result = await execute_session_query(session, query)
-        record = get_record_or_404(result)
+        result = await execute_session_query(session, query, pk.model_dump())
+        get_rowcount_or_404(result)
 
-        await delete_session_record(session, record)
         await commit_session(session)
+        clear_table_count(session, table)
 
     return delete_record_handler
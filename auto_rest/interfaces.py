@@ -19,30 +19,69 @@ which force interface fields to be optional or read only.
     ```
 """
 
-from typing import Any, Iterator, Literal
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Any, Literal
 
-from pydantic import BaseModel as PydanticModel, create_model
-from sqlalchemy import Column, Table
+from pydantic import BaseModel as PydanticModel, ConfigDict, create_model
+from sqlalchemy import Column, Table, types
 
 __all__ = ["create_interface"]
 
 MODE_TYPE = Literal["default", "required", "optional"]
 
+# Model configuration shared by all generated interfaces
+INTERFACE_CONFIG = ConfigDict(arbitrary_types_allowed=True)
 
-def iter_columns(table: Table, pk_only: bool = False) -> Iterator[Column]:
-    """Iterate over the columns of a SQLAlchemy model.
+# Python types for common SQLAlchemy column types, keyed by the exact type class.
+# Types whose Python type depends on column arguments (e.g., `Numeric`, `Enum`) are excluded.
+PYTHON_TYPES = {
+    types.Integer: int, types.INTEGER: int,
+    types.BigInteger: int, types.BIGINT: int,
+    types.SmallInteger: int, types.SMALLINT: int,
+    types.String: str, types.VARCHAR: str, types.CHAR: str,
+    types.Text: str, types.TEXT: str,
+    types.Unicode: str, types.NVARCHAR: str, types.NCHAR: str,
+    types.UnicodeText: str,
+    types.Boolean: bool, types.BOOLEAN: bool,
+    types.Date: date, types.DATE: date,
+    types.DateTime: datetime, types.DATETIME: datetime, types.TIMESTAMP: datetime,
+    types.Time: time, types.TIME: time,
+    types.Interval: timedelta,
+    types.LargeBinary: bytes, types.BLOB: bytes,
+}
+
+
+@lru_cache(maxsize=None)
+def _optional(col_type: type[any]) -> type[any]:
+    """Return an optional version of the given type, reusing previously constructed unions."""
+
+    return col_type | None
+
+
+@lru_cache(maxsize=None)
+def _column_spec(col: Column) -> tuple[type[any], any, bool]:
+    """Return the Python type, default value, and optionality of a database table column.
+
+    Results are cached so column attributes are only resolved once across all interface modes.
 
     Args:
-        table: The table to iterate columns over.
-        pk_only: If True, only iterate over primary key columns.
+        col: The column to return values for.
 
-    Yields:
-        A column of the SQLAlchemy model.
+    Returns:
+        A tuple with the column type, default value, and whether the column is optional by default.
     """
 
-    for column in table.columns.values():
-        if column.primary_key or not pk_only:
-            yield column
+    col_type = PYTHON_TYPES.get(type(col.type))
+    if col_type is None:
+        try:
+            col_type = col.type.python_type
+
+        except NotImplementedError:
+            col_type = Any
+
+    col_default = getattr(col.default, "arg", col.default)
+    return col_type, col_default, bool(col.nullable or col.default)
 
 
 def create_field_definition(col: Column, mode: MODE_TYPE = "default") -> tuple[type[any], any]:
@@ -65,22 +104,16 @@ def create_field_definition(col: Column, mode: MODE_TYPE = "default") -> tuple[t
         The default value for the column.
     """
 
-    try:
-        col_type = col.type.python_type
-
-    except NotImplementedError:
-        col_type = Any
-
-    col_default = getattr(col.default, "arg", col.default)
+    col_type, col_default, col_optional = _column_spec(col)
 
     if mode == "required":
         return col_type, ...
 
     elif mode == "optional":
-        return col_type | None, col_default
+        return _optional(col_type), col_default
 
-    elif mode == "default" and (col.nullable or col.default):
-        return col_type | None, col_default
+    elif mode == "default" and col_optional:
+        return _optional(col_type), col_default
 
     elif mode == "default":
         return col_type, ...
@@ -91,6 +124,11 @@ def create_field_definition(col: Column, mode: MODE_TYPE = "default") -> tuple[t
 def create_interface(table: Table, pk_only: bool = False, mode: MODE_TYPE = "default") -> type[PydanticModel]:
     """Create a Pydantic interface for a SQLAlchemy model where all fields are required.
 
+    Interfaces are cached, and repeated calls with the same arguments return
+    the same class regardless of whether arguments are passed by position or
+    keyword. Cached interfaces keep their table alive for the life of the
+    process unless released with `create_interface.cache_clear()`.
+
     Modes:
         default: Values are marked as (not)required based on the column schema.
         required: Values are always marked required.
@@ -105,14 +143,24 @@ def create_interface(table: Table, pk_only: bool = False, mode: MODE_TYPE = "def
         A dynamically generated Pydantic model with all fields required.
     """
 
+    # Arguments are normalized to positional values so every calling style shares one cache entry
+    return _create_interface(table, bool(pk_only), mode)
+
+
+@lru_cache(maxsize=None)
+def _create_interface(table: Table, pk_only: bool, mode: MODE_TYPE) -> type[PydanticModel]:
+    """Build and cache the interface returned by `create_interface`."""
+
     # Map field names to the column type and default value.
-    fields = {
-        col.name: create_field_definition(col, mode) for col in iter_columns(table, pk_only)
-    }
+    columns = table.primary_key.columns if pk_only else table.columns
+    fields = {col.name: create_field_definition(col, mode) for col in columns}
 
     # Create a unique name for the interface
     name = f"{table.name}-{mode.title()}"
     if pk_only:
         name += '-PK'
 
-    return create_model(name, __config__={'arbitrary_types_allowed': True}, **fields)
+    return create_model(name, __config__=INTERFACE_CONFIG, **fields)
+
+
+create_interface.cache_clear = _create_interface.cache_clear
@@ -30,14 +30,22 @@ connection and session handling are configured accordingly.
 """
 
 import asyncio
+import hashlib
 import logging
+import os
+import pickle
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, AsyncGenerator, Callable, Generator
 
 import yaml
-from sqlalchemy import create_engine, Engine, MetaData, URL
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
-from sqlalchemy.orm import Session
+from sqlalchemy import __version__ as sqlalchemy_version, create_engine, Engine, MetaData, URL
+from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, StaticPool
 
 __all__ = [
     "DBEngine",
@@ -55,6 +63,27 @@ logger = logging.getLogger("auto_rest")
 DBEngine = Engine | AsyncEngine
 DBSession = Session | AsyncSession
 
+# Default connection pool settings for server based databases.
+POOL_DEFAULTS = {
+    "pool_size": 20,
+    "max_overflow": 10,
+    "pool_pre_ping": True,
+    "pool_recycle": 3600,
+    "pool_timeout": 30,
+}
+
+# Size of the compiled SQL statement cache (SQLAlchemy defaults to 500).
+# Each table contributes several statements, plus one per filter and ordering combination on list queries.
+QUERY_CACHE_SIZE = 2048
+
+# Driver specific overrides for the default pool settings.
+# asyncpg skips the per-checkout ping query and instead recycles connections before common idle timeouts.
+# MySQL servers are often configured to drop idle connections after a few minutes.
+DRIVER_POOL_DEFAULTS = {
+    "asyncpg": {"pool_pre_ping": False, "pool_recycle": 1800},
+    "aiomysql": {"pool_recycle": 280},
+}
+
 
 def parse_db_settings(path: Path | None) -> dict[str, Any]:
     """Parse engine configuration settings from a given file path.
@@ -97,8 +126,12 @@ def create_db_url(
     """
 
     # Handle special case where SQLite uses file paths.
-    if "sqlite" in driver:
-        path = Path(database).resolve()
+    # Absolute paths are used as given to avoid filesystem lookups.
+    if driver.startswith("sqlite"):
+        path = Path(database)
+        if not path.is_absolute():
+            path = path.resolve()
+
         url = URL.create(drivername=driver, database=str(path))
 
     else:
@@ -120,6 +153,13 @@ def create_db_engine(url: URL, **kwargs: dict[str: any]) -> DBEngine:
 
     Instantiates and returns an `Engine` or `AsyncEngine` instance depending
     on whether the database URL uses a driver with support for async operations.
+    Connection pools for server based databases are configured using
+    `POOL_DEFAULTS` and any driver specific values in `DRIVER_POOL_DEFAULTS`.
+    Both are overridden by any matching keyword arguments. Pools default to
+    `AsyncAdaptedQueuePool` (async) or `QueuePool` (sync), and the default
+    settings are skipped entirely when a custom `poolclass` is provided.
+    The compiled statement cache is sized using `QUERY_CACHE_SIZE` unless
+    `query_cache_size` is given.
 
     Args:
         url: A fully qualified database URL.
@@ -129,46 +169,121 @@ def create_db_engine(url: URL, **kwargs: dict[str: any]) -> DBEngine:
         A SQLAlchemy `Engine` or `AsyncEngine` instance.
     """
 
-    if url.get_dialect().is_async:
+    is_async = url.get_dialect().is_async
+    kwargs = {"query_cache_size": QUERY_CACHE_SIZE, **kwargs}
+
+    # SQLite manages its own file based connection pools
+    if url.get_backend_name() != "sqlite" and "poolclass" not in kwargs:
+        kwargs = {**POOL_DEFAULTS, **DRIVER_POOL_DEFAULTS.get(url.get_driver_name(), {}), **kwargs}
+        kwargs["poolclass"] = AsyncAdaptedQueuePool if is_async else QueuePool
+
+    if is_async:
         engine = create_async_engine(url, **kwargs)
-        logger.debug("Asynchronous connection established.")
+        logger.debug(f"Asynchronous connection established using {type(engine.pool).__name__}.")
         return engine
 
     else:
         engine = create_engine(url, **kwargs)
-        logger.debug("Synchronous connection established.")
+        logger.debug(f"Synchronous connection established using {type(engine.pool).__name__}.")
         return engine
 
 
-async def _async_reflect_metadata(engine: AsyncEngine, metadata: MetaData) -> None:
+async def _async_reflect_metadata(engine: AsyncEngine, metadata: MetaData, only: list[str] | None = None) -> None:
     """Helper function used to reflect database metadata using an async engine."""
 
     async with engine.connect() as connection:
-        await connection.run_sync(metadata.reflect, views=True)
+        await connection.run_sync(metadata.reflect, views=True, only=only)
 
+    # Pooled connections are bound to the reflection event loop and cannot be reused by the server.
+    # Static pools hold the only connection to in-memory databases and are left intact.
+    if not isinstance(engine.pool, StaticPool):
+        await engine.dispose()
 
-def create_db_metadata(engine: DBEngine) -> MetaData:
+
+def create_db_metadata(
+    engine: DBEngine,
+    only: list[str] | None = None,
+    cache_dir: Path | None = None,
+    cache_ttl: float | None = None,
+) -> MetaData:
     """Create and reflect metadata for the database connection.
 
+    If a cache directory is provided, reflected metadata is saved to disk and
+    reused by subsequent calls for the same database URL and table selection.
+    Cached metadata is reflected again once it is older than the cache TTL.
+    Without a TTL, cached files never expire and should be deleted after
+    changes to the database schema. Unreadable cache files, or files not
+    containing a `MetaData` object, are deleted and replaced with freshly
+    reflected metadata.
+
+    Asynchronous engines are reflected on a separate thread when called
+    from within a running event loop.
+
     Args:
         engine: The database engine to use for reflection.
+        only: Optionally limit reflection to the given table names.
+        cache_dir: Optional directory used to cache reflected metadata.
+        cache_ttl: Optional number of seconds before cached metadata expires.
 
     Returns:
         A MetaData object reflecting the database schema.
     """
 
+    cache_path = None
+    if cache_dir is not None:
+        # Table selections are order independent and share a cache file
+        tables = None if only is None else tuple(sorted(set(only)))
+        cache_key = repr((engine.url.render_as_string(hide_password=False), tables, sqlalchemy_version))
+        cache_path = cache_dir / f"metadata-{hashlib.sha256(cache_key.encode()).hexdigest()}.pickle"
+
+        if cache_path.exists() and (cache_ttl is None or time.time() - cache_path.stat().st_mtime < cache_ttl):
+            logger.debug(f"Loading cached database metadata from {cache_path}.")
+            try:
+                cached = pickle.loads(cache_path.read_bytes())
+
+            # Corrupted pickles can raise almost any exception type
+            except Exception as exc:
+                cached = exc
+
+            if isinstance(cached, MetaData):
+                return cached
+
+            logger.warning(f"Discarding unreadable metadata cache {cache_path}: {cached!r}")
+            cache_path.unlink(missing_ok=True)
+
     logger.debug("Loading database metadata.")
     metadata = MetaData()
 
     if isinstance(engine, AsyncEngine):
-        asyncio.run(_async_reflect_metadata(engine, metadata))
+        try:
+            asyncio.get_running_loop()
+
+        except RuntimeError:
+            asyncio.run(_async_reflect_metadata(engine, metadata, only))
+
+        else:
+            # Event loops cannot be nested, so reflection runs on a separate thread with its own loop
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                executor.submit(asyncio.run, _async_reflect_metadata(engine, metadata, only)).result()
 
     else:
-        metadata.reflect(bind=engine, views=True)
+        metadata.reflect(bind=engine, views=True, only=only)
+
+    if cache_path is not None:
+        logger.debug(f"Caching database metadata to {cache_path}.")
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file and move it into place so interrupted writes never leave a truncated cache
+        data = pickle.dumps(metadata)
+        with tempfile.NamedTemporaryFile(dir=cache_path.parent, suffix=".tmp", delete=False) as temp_file:
+            temp_file.write(data)
+
+        os.replace(temp_file.name, cache_path)
 
     return metadata
 
 
+@lru_cache(maxsize=None)
 def create_session_iterator(engine: DBEngine) -> Callable[[], Generator[Session, None, None] | AsyncGenerator[AsyncSession, None]]:
     """Create a generator for database sessions.
 
@@ -177,6 +292,14 @@ def create_session_iterator(engine: DBEngine) -> Callable[[], Generator[Session,
     returned also depends on the underlying database engine, and will
     either be a `Session` or `AsyncSession` instance.
 
+    Sessions are built from a single session factory per engine, and
+    repeated calls with the same engine return the same function. Cached
+    functions keep their engine alive for the life of the process unless
+    released with `create_session_iterator.cache_clear()`.
+    Records are not expired on commit, avoiding an additional `SELECT`
+    when accessing committed values. Autoflush is disabled since handlers
+    execute Core statements and never add pending ORM objects.
+
     Args:
         engine: Database engine to use when generating new sessions.
 
@@ -185,13 +308,17 @@ def create_session_iterator(engine: DBEngine) -> Callable[[], Generator[Session,
     """
 
     if isinstance(engine, AsyncEngine):
+        async_session_factory = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
         async def session_iterator() -> AsyncGenerator[AsyncSession, None]:
-            async with AsyncSession(bind=engine, autocommit=False, autoflush=True) as session:
+            async with async_session_factory() as session:
                 yield session
 
     else:
+        session_factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
         def session_iterator() -> Generator[Session, None, None]:
-            with Session(bind=engine, autocommit=False, autoflush=True) as session:
+            with session_factory() as session:
                 yield session
 
     return session_iterator
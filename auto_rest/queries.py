@@ -21,23 +21,48 @@ handling and provides a streamlined interface for database interactions.
 """
 
 import logging
+import time
+from typing import AsyncGenerator, Sequence
 
 from fastapi import HTTPException
-from sqlalchemy import Executable, Result
+from sqlalchemy import Executable, func, Result, Row, select, Table, URL
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
 from auto_rest.models import DBSession
 
 __all__ = [
+    "clear_table_count",
     "commit_session",
+    "count_table_records",
     "delete_session_record",
     "execute_session_query",
-    "get_record_or_404"
+    "get_record_or_404",
+    "get_rowcount_or_404",
+    "stream_session_query",
 ]
 
 logger = logging.getLogger("auto_rest.query")
 
+# Record counts at or above the threshold are cached for `COUNT_CACHE_TTL` seconds.
+COUNT_CACHE_THRESHOLD = 1000
+COUNT_CACHE_TTL = 60
+_count_cache: dict[tuple[URL, Table], tuple[int, float]] = {}
+
+
+def clear_table_count(session: DBSession, table: Table) -> None:
+    """Discard any cached record count for a database table.
+
+    Intended for use after committing inserts or deletes so subsequent
+    calls to `count_table_records` reflect the changes.
+
+    Args:
+        session: A session bound to the database containing the table.
+        table: The database table to clear the cached count for.
+    """
+
+    _count_cache.pop((session.get_bind().url, table), None)
+
 
 async def commit_session(session: DBSession) -> None:
     """Commit a SQLAlchemy session.
@@ -55,6 +80,42 @@ async def commit_session(session: DBSession) -> None:
         session.commit()
 
 
+async def count_table_records(session: DBSession, table: Table) -> int:
+    """Return the total number of records in a database table.
+
+    Counting records in large tables can dominate the cost of paginated
+    queries. Record counts at or above `COUNT_CACHE_THRESHOLD` are cached
+    and reused for `COUNT_CACHE_TTL` seconds. Smaller tables are cheap to
+    count and are always queried directly. Cached counts are tracked per
+    database and table, and are not refreshed by writes from other processes
+    or sessions until they expire (see `clear_table_count`).
+
+    Args:
+        session: The SQLAlchemy session to use for executing the query.
+        table: The database table to count records for.
+
+    Returns:
+        The number of records in the table.
+    """
+
+    now = time.monotonic()
+    cache_key = (session.get_bind().url, table)
+    cached = _count_cache.get(cache_key)
+    if cached is not None and cached[1] > now:
+        return cached[0]
+
+    result = await execute_session_query(session, select(func.count()).select_from(table))
+    count = result.scalar_one()
+
+    if count >= COUNT_CACHE_THRESHOLD:
+        _count_cache[cache_key] = (count, now + COUNT_CACHE_TTL)
+
+    else:
+        _count_cache.pop(cache_key, None)
+
+    return count
+
+
 async def delete_session_record(session: DBSession, record: Result) -> None:
     """Delete a record from the database using an existing session.
 
@@ -74,7 +135,7 @@ async def delete_session_record(session: DBSession, record: Result) -> None:
         session.delete(record)
 
 
-async def execute_session_query(session: DBSession, query: Executable) -> Result:
+async def execute_session_query(session: DBSession, query: Executable, params: dict[str, any] | None = None) -> Result:
     """Execute a query in the given session and return the result.
 
     Supports synchronous and asynchronous sessions.
@@ -82,16 +143,20 @@ async def execute_session_query(session: DBSession, query: Executable) -> Result
     Args:
         session: The SQLAlchemy session to use for executing the query.
         query: The query to be executed.
+        params: Optional values for bound parameters in the query.
 
     Returns:
         The result of the executed query.
     """
 
-    logger.debug(str(query).replace("\n", " "))
+    # Compiling the query to a string is expensive and only done when debug logging is enabled
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(str(query).replace("\n", " "))
+
     if isinstance(session, AsyncSession):
-        return await session.execute(query)
+        return await session.execute(query, params)
 
-    return session.execute(query)
+    return session.execute(query, params)
 
 
 def get_record_or_404(result: Result) -> any:
@@ -107,7 +172,65 @@ def get_record_or_404(result: Result) -> any:
         HTTPException: If the record is not found.
     """
 
-    if record := result.fetchone():
-        return record
+    if (record := result.fetchone()) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Record not found")
+
+    return record
+
+
+def get_rowcount_or_404(result: Result) -> int:
+    """Retrieve the number of rows matched by a query or raise a 404 error.
+
+    Intended for `UPDATE` and `DELETE` statements, where the affected row
+    count signals whether the target record exists.
+
+    Args:
+        result: The query result to extract the row count from.
+
+    Returns:
+        The number of rows matched by the query.
+
+    Raises:
+        HTTPException: If no rows were matched.
+    """
+
+    if rowcount := result.rowcount:
+        return rowcount
 
     raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Record not found")
+
+
+async def stream_session_query(
+    session: DBSession,
+    query: Executable,
+    params: dict[str, any] | None = None,
+    partition_size: int = 100,
+) -> AsyncGenerator[Sequence[Row], None]:
+    """Execute a query and yield result rows in partitions as they are fetched.
+
+    Rows are fetched using a server side cursor where supported by the
+    database driver, avoiding buffering the full result in memory.
+    Supports synchronous and asynchronous sessions.
+
+    Args:
+        session: The SQLAlchemy session to use for executing the query.
+        query: The query to be executed.
+        params: Optional values for bound parameters in the query.
+        partition_size: The maximum number of rows in each partition.
+
+    Returns:
+        An async generator yielding lists of result rows.
+    """
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(str(query).replace("\n", " "))
+
+    if isinstance(session, AsyncSession):
+        result = await session.stream(query, params)
+        async for partition in result.partitions(partition_size):
+            yield partition
+
+    else:
+        result = session.execute(query, params, execution_options={"stream_results": True})
+        for partition in result.partitions(partition_size):
+            yield partition
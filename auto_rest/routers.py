@@ -24,6 +24,7 @@ routers to be added directly to an API application instance.
 """
 
 import logging
+from operator import attrgetter
 
 from fastapi import APIRouter
 from sqlalchemy import MetaData, Table
@@ -123,64 +124,33 @@ def create_table_router(engine: DBEngine, table: Table) -> APIRouter:
     logger.debug(f"Creating endpoints for table `{table.name}`.")
     router = APIRouter()
 
-    # Construct path parameters from primary key columns
-    pk_columns = sorted(column.name for column in table.primary_key.columns)
+    # Construct the record path from primary key columns once and share it across routes
+    pk_columns = sorted(map(attrgetter("name"), table.primary_key.columns))
     path_params_url = "/".join(f"{{{col_name}}}" for col_name in pk_columns)
+    record_path = f"/{path_params_url}/"
 
-    # Add routes for operations against the table
-    router.add_api_route(
-        path="/",
-        methods=["GET"],
-        endpoint=create_list_records_handler(engine, table),
-        status_code=status.HTTP_200_OK,
-        summary="Fetch multiple records from the table.",
-        tags=[table.name],
-    )
-
-    router.add_api_route(
-        path="/",
-        methods=["POST"],
-        endpoint=create_post_record_handler(engine, table),
-        status_code=status.HTTP_201_CREATED,
-        summary="Create a new record.",
-        tags=[table.name],
-    )
+    # Route specifications as (path, method, handler factory, status code, summary)
+    routes = [
+        ("/", "GET", create_list_records_handler, status.HTTP_200_OK, "Fetch multiple records from the table."),
+        ("/", "POST", create_post_record_handler, status.HTTP_201_CREATED, "Create a new record."),
+    ]
 
-    # Add route for read operations against individual records
+    # Add routes for operations against individual records
     if pk_columns:
+        routes += [
+            (record_path, "GET", create_get_record_handler, status.HTTP_200_OK, "Fetch a single record from the table."),
+            (record_path, "PUT", create_put_record_handler, status.HTTP_200_OK, "Replace a single record in the table."),
+            (record_path, "PATCH", create_patch_record_handler, status.HTTP_200_OK, "Update a single record in the table."),
+            (record_path, "DELETE", create_delete_record_handler, status.HTTP_200_OK, "Delete a single record from the table."),
+        ]
+
+    for path, method, handler_factory, status_code, summary in routes:
         router.add_api_route(
-            path=f"/{path_params_url}/",
-            methods=["GET"],
-            endpoint=create_get_record_handler(engine, table),
-            status_code=status.HTTP_200_OK,
-            summary="Fetch a single record from the table.",
-            tags=[table.name],
-        )
-
-        router.add_api_route(
-            path=f"/{path_params_url}/",
-            methods=["PUT"],
-            endpoint=create_put_record_handler(engine, table),
-            status_code=status.HTTP_200_OK,
-            summary="Replace a single record in the table.",
-            tags=[table.name],
-        )
-
-        router.add_api_route(
-            path=f"/{path_params_url}/",
-            methods=["PATCH"],
-            endpoint=create_patch_record_handler(engine, table),
-            status_code=status.HTTP_200_OK,
-            summary="Update a single record in the table.",
-            tags=[table.name],
-        )
-
-        router.add_api_route(
-            path=f"/{path_params_url}/",
-            methods=["DELETE"],
-            endpoint=create_delete_record_handler(engine, table),
-            status_code=status.HTTP_200_OK,
-            summary="Delete a single record from the table.",
+            path=path,
+            methods=[method],
+            endpoint=handler_factory(engine, table),
+            status_code=status_code,
+            summary=summary,
             tags=[table.name],
         )
 
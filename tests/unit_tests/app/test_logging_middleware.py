@@ -1,11 +1,11 @@
 import logging
 import unittest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from fastapi import Request
 from starlette.responses import Response
 
-from auto_rest.app import logging_middleware
+from auto_rest.app import logger, logging_middleware
 
 
 class TestLoggingMiddleware(unittest.IsolatedAsyncioTestCase):
@@ -60,3 +60,14 @@ class TestLoggingMiddleware(unittest.IsolatedAsyncioTestCase):
             any("Test exception" in message for message in caplog.output),
             "Expected log message for 'Test exception' not found in logs."
         )
+
+    async def test_logging_middleware_disabled(self) -> None:
+        """Verify request metadata is not extracted when logging is disabled."""
+
+        self.request.client = None
+        call_next = AsyncMock(return_value=Response(status_code=200))
+
+        with patch.object(logger, "isEnabledFor", return_value=False):
+            response = await logging_middleware(self.request, call_next)
+
+        self.assertEqual(200, response.status_code)
@@ -72,6 +72,9 @@ class TestCreateCliParser(TestCase):
         self.assertEqual("default", default_args.db_name)
         self.assertIsNone(default_args.db_port)
         self.assertIsNone(default_args.db_config)
+        self.assertIsNone(default_args.db_tables)
+        self.assertIsNone(default_args.schema_cache)
+        self.assertIsNone(default_args.schema_cache_ttl)
 
         # Test parsing custom values
         config_path = Path("/path/to/db-config.yaml")
@@ -81,13 +84,19 @@ class TestCreateCliParser(TestCase):
             "--db-name", "default",
             "--db-user", "user",
             "--db-pass", "password",
-            "--db-config", str(config_path)
+            "--db-config", str(config_path),
+            "--db-tables", "table1", "table2",
+            "--schema-cache", "/path/to/cache",
+            "--schema-cache-ttl", "60",
         ])
 
         self.assertEqual("localhost", custom_args.db_host)
         self.assertEqual("user", custom_args.db_user)
         self.assertEqual("password", custom_args.db_pass)
         self.assertEqual(config_path, custom_args.db_config)
+        self.assertEqual(["table1", "table2"], custom_args.db_tables)
+        self.assertEqual(Path("/path/to/cache"), custom_args.schema_cache)
+        self.assertEqual(60, custom_args.schema_cache_ttl)
 
     def test_server_settings(self) -> None:
         """Verify server-related settings and default values."""
@@ -26,3 +26,9 @@ class TestCreateAboutHandler(TestCase):
         response = self.client.get("/")
         self.assertEqual(200, response.status_code)
         self.assertEqual(response.json(), {"name": self.name, "version": self.version})
+
+    def test_handler_content_type(self) -> None:
+        """Verify the precomputed response is returned as JSON."""
+
+        response = self.client.get("/")
+        self.assertEqual("application/json", response.headers["content-type"])
@@ -0,0 +1,60 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import Column, create_engine, insert, Integer, MetaData, select, StaticPool, Table
+
+from auto_rest import queries
+from auto_rest.handlers import create_delete_record_handler, create_list_records_handler
+
+
+class TestCreateDeleteRecordHandler(TestCase):
+    """Unit tests for the `create_delete_record_handler` function."""
+
+    def setUp(self) -> None:
+        """Set up a populated database table, FastAPI app, and test client."""
+
+        self.engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        self.table = Table("numbers", MetaData(), Column("id", Integer, primary_key=True))
+        self.table.metadata.create_all(self.engine)
+        with self.engine.begin() as connection:
+            connection.execute(insert(self.table), [{"id": 1}, {"id": 2}])
+
+        app = FastAPI()
+        app.add_api_route("/", create_list_records_handler(self.engine, self.table))
+        app.add_api_route("/{id}/", create_delete_record_handler(self.engine, self.table), methods=["DELETE"])
+        self.client = TestClient(app)
+
+    def tearDown(self) -> None:
+        """Clear any cached record counts."""
+
+        queries._count_cache.clear()
+
+    def get_ids(self) -> list[int]:
+        """Return the IDs of all records in the database."""
+
+        with self.engine.connect() as connection:
+            return list(connection.execute(select(self.table.c.id).order_by(self.table.c.id)).scalars())
+
+    def test_delete_record(self) -> None:
+        """Verify the requested record is deleted."""
+
+        response = self.client.delete("/1/")
+        self.assertEqual(200, response.status_code)
+        self.assertEqual([2], self.get_ids())
+
+    def test_cached_count_cleared(self) -> None:
+        """Verify cached record counts are refreshed after a record is deleted."""
+
+        with patch.object(queries, "COUNT_CACHE_THRESHOLD", 0):
+            self.assertEqual("2", self.client.get("/").headers["x-pagination-total"])
+            self.client.delete("/1/")
+            self.assertEqual("1", self.client.get("/").headers["x-pagination-total"])
+
+    def test_missing_record(self) -> None:
+        """Verify a 404 status is returned for records that do not exist."""
+
+        response = self.client.delete("/3/")
+        self.assertEqual(404, response.status_code)
+        self.assertEqual([1, 2], self.get_ids())
@@ -28,3 +28,9 @@ class TestCreateEngineHandler(TestCase):
         response = self.client.get("/")
         self.assertEqual(200, response.status_code)
         self.assertEqual(response.json(), self.config)
+
+    def test_engine_handler_content_type(self) -> None:
+        """Verify the precomputed response is returned as JSON."""
+
+        response = self.client.get("/")
+        self.assertEqual("application/json", response.headers["content-type"])
@@ -0,0 +1,82 @@
+from unittest import TestCase
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import Column, create_engine, insert, Integer, MetaData, StaticPool, String, Table
+
+from auto_rest.handlers import create_get_record_handler
+
+
+class TestCreateGetRecordHandler(TestCase):
+    """Unit tests for the `create_get_record_handler` function."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up a populated database table, FastAPI app, and test client."""
+
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        table = Table("users", MetaData(), Column("id", Integer, primary_key=True), Column("name", String))
+        table.metadata.create_all(engine)
+        with engine.begin() as connection:
+            connection.execute(insert(table), [{"id": 1, "name": "alice"}, {"id": 2, "name": "bob"}])
+
+        app = FastAPI()
+        app.add_api_route("/{id}/", create_get_record_handler(engine, table))
+        cls.client = TestClient(app)
+
+    def test_get_record(self) -> None:
+        """Verify the handler returns the requested record with an ETag header."""
+
+        response = self.client.get("/1/")
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({"id": 1, "name": "alice"}, response.json())
+        self.assertTrue(response.headers["etag"].startswith('W/"'))
+
+    def test_missing_record(self) -> None:
+        """Verify a 404 status is returned for records that do not exist."""
+
+        response = self.client.get("/3/")
+        self.assertEqual(404, response.status_code)
+
+    def test_etag_differs_between_records(self) -> None:
+        """Verify records with different values have different ETags."""
+
+        self.assertNotEqual(self.client.get("/1/").headers["etag"], self.client.get("/2/").headers["etag"])
+
+    def test_matching_etag_not_modified(self) -> None:
+        """Verify a 304 status with no body is returned for a matching ETag."""
+
+        etag = self.client.get("/1/").headers["etag"]
+        response = self.client.get("/1/", headers={"if-none-match": f'W/"other", {etag}'})
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(etag, response.headers["etag"])
+        self.assertEqual(b"", response.content)
+
+    def test_strong_etag_not_modified(self) -> None:
+        """Verify ETags sent without the weak `W/` prefix still match."""
+
+        etag = self.client.get("/1/").headers["etag"]
+        response = self.client.get("/1/", headers={"if-none-match": etag.removeprefix("W/")})
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(etag, response.headers["etag"])
+
+    def test_wildcard_not_modified(self) -> None:
+        """Verify a `*` value matches any existing record."""
+
+        response = self.client.get("/1/", headers={"if-none-match": "*"})
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(self.client.get("/1/").headers["etag"], response.headers["etag"])
+
+    def test_wildcard_missing_record(self) -> None:
+        """Verify a `*` value does not suppress 404 errors for missing records."""
+
+        response = self.client.get("/3/", headers={"if-none-match": "*"})
+        self.assertEqual(404, response.status_code)
+
+    def test_stale_etag_returns_record(self) -> None:
+        """Verify the full record is returned for a non-matching ETag."""
+
+        etag = self.client.get("/2/").headers["etag"]
+        response = self.client.get("/1/", headers={"if-none-match": etag})
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({"id": 1, "name": "alice"}, response.json())
@@ -0,0 +1,93 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import Column, create_engine, insert, Integer, MetaData, StaticPool, Table
+
+from auto_rest import handlers
+from auto_rest.handlers import create_list_records_handler
+
+
+class TestCreateListRecordsHandler(TestCase):
+    """Unit tests for the `create_list_records_handler` function."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up a populated database table, FastAPI app, and test client."""
+
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        table = Table("numbers", MetaData(), Column("id", Integer, primary_key=True))
+        table.metadata.create_all(engine)
+        with engine.begin() as connection:
+            connection.execute(insert(table), [{"id": i} for i in range(10)])
+
+        app = FastAPI()
+        app.add_api_route("/", create_list_records_handler(engine, table))
+        cls.client = TestClient(app)
+        cls.engine = engine
+        cls.table = table
+
+    def test_handler_reuse(self) -> None:
+        """Verify repeated calls with the same engine and table return the same handler."""
+
+        handler = create_list_records_handler(self.engine, self.table)
+        self.assertIs(handler, create_list_records_handler(self.engine, self.table))
+
+    def test_handler_cache_clear(self) -> None:
+        """Verify clearing the factory cache releases previously created handlers."""
+
+        handler = create_list_records_handler(self.engine, self.table)
+        create_list_records_handler.cache_clear()
+        self.assertIsNot(handler, create_list_records_handler(self.engine, self.table))
+
+    def test_limit_and_offset(self) -> None:
+        """Verify records are paginated using the requested limit and offset."""
+
+        response = self.client.get("/", params={"_limit_": 3, "_offset_": 2})
+        self.assertEqual(200, response.status_code)
+        self.assertEqual([{"id": 2}, {"id": 3}, {"id": 4}], response.json())
+        self.assertEqual("3", response.headers["x-pagination-limit"])
+        self.assertEqual("10", response.headers["x-pagination-total"])
+
+    def test_ordering(self) -> None:
+        """Verify records are sorted by the requested column and direction."""
+
+        response = self.client.get("/", params={"_limit_": 3, "_order_by_": "id", "_direction_": "desc"})
+        self.assertEqual([{"id": 9}, {"id": 8}, {"id": 7}], response.json())
+        self.assertEqual("id", response.headers["x-order-by"])
+        self.assertEqual("desc", response.headers["x-order-direction"])
+
+    def test_ndjson_stream(self) -> None:
+        """Verify records are streamed as newline delimited JSON when requested."""
+
+        response = self.client.get("/", params={"_limit_": 3}, headers={"accept": "application/x-ndjson"})
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("application/x-ndjson", response.headers["content-type"])
+        self.assertEqual('{"id":0}\n{"id":1}\n{"id":2}\n', response.text)
+        self.assertEqual("10", response.headers["x-pagination-total"])
+
+    def test_limit_is_capped(self) -> None:
+        """Verify limits above the maximum page size are clamped."""
+
+        with patch.object(handlers, "MAX_PAGE_SIZE", 5):
+            response = self.client.get("/", params={"_limit_": 100})
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(5, len(response.json()))
+        self.assertEqual("5", response.headers["x-pagination-limit"])
+
+    def test_zero_limit_uses_max_page_size(self) -> None:
+        """Verify a zero limit falls back to the maximum page size."""
+
+        with patch.object(handlers, "MAX_PAGE_SIZE", 5):
+            response = self.client.get("/")
+
+        self.assertEqual(5, len(response.json()))
+        self.assertEqual("5", response.headers["x-pagination-limit"])
+
+    def test_offset_is_capped(self) -> None:
+        """Verify offsets above the maximum are rejected."""
+
+        response = self.client.get("/", params={"_offset_": handlers.MAX_PAGE_OFFSET + 1})
+        self.assertEqual(422, response.status_code)
@@ -0,0 +1,80 @@
+from unittest import TestCase
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import Column, create_engine, event, insert, Integer, MetaData, select, StaticPool, String, Table
+
+from auto_rest.handlers import create_patch_record_handler
+
+
+class TestCreatePatchRecordHandler(TestCase):
+    """Unit tests for the `create_patch_record_handler` function."""
+
+    update_returning = True
+
+    def setUp(self) -> None:
+        """Set up a populated database table, FastAPI app, and test client."""
+
+        self.engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        self.engine.dialect.update_returning = self.update_returning
+
+        self.table = Table("users", MetaData(), Column("id", Integer, primary_key=True), Column("name", String))
+        self.table.metadata.create_all(self.engine)
+        with self.engine.begin() as connection:
+            connection.execute(insert(self.table), [{"id": 1, "name": "alice"}, {"id": 2, "name": "bob"}])
+
+        # Record executed SQL statements to verify which update strategy is used
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute", lambda *args: self.statements.append(args[2]))
+
+        app = FastAPI()
+        app.add_api_route("/{id}/", create_patch_record_handler(self.engine, self.table), methods=["PATCH"])
+        self.client = TestClient(app)
+
+    def get_names(self) -> dict[int, str]:
+        """Return a mapping of record IDs to names from the database."""
+
+        with self.engine.connect() as connection:
+            return dict(connection.execute(select(self.table.c.id, self.table.c.name)).all())
+
+    def test_update_record(self) -> None:
+        """Verify the provided values are updated and the full record is returned."""
+
+        response = self.client.patch("/1/", json={"id": 1, "name": "carol"})
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({"id": 1, "name": "carol"}, response.json())
+        self.assertEqual({1: "carol", 2: "bob"}, self.get_names())
+
+    def test_returning_clause(self) -> None:
+        """Verify `UPDATE ... RETURNING` is only used when supported by the database dialect."""
+
+        self.client.patch("/1/", json={"id": 1, "name": "carol"})
+        self.assertEqual(self.update_returning, any("RETURNING" in statement for statement in self.statements))
+
+    def test_missing_record(self) -> None:
+        """Verify a 404 status is returned for records that do not exist."""
+
+        response = self.client.patch("/3/", json={"id": 3, "name": "carol"})
+        self.assertEqual(404, response.status_code)
+        self.assertEqual({1: "alice", 2: "bob"}, self.get_names())
+
+    def test_unset_fields_unchanged(self) -> None:
+        """Verify fields missing from the request body are not modified."""
+
+        response = self.client.patch("/1/", json={"id": 1})
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({"id": 1, "name": "alice"}, response.json())
+
+    def test_primary_key_from_path(self) -> None:
+        """Verify the primary key from the URL path takes precedence over the request body."""
+
+        response = self.client.patch("/1/", json={"id": 2, "name": "carol"})
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({"id": 1, "name": "carol"}, response.json())
+        self.assertEqual({1: "carol", 2: "bob"}, self.get_names())
+
+
+class TestCreatePatchRecordHandlerWithoutReturning(TestCreatePatchRecordHandler):
+    """Unit tests for the `create_patch_record_handler` function on databases without `UPDATE ... RETURNING`."""
+
+    update_returning = False
@@ -0,0 +1,60 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import Column, create_engine, insert, Integer, MetaData, select, StaticPool, String, Table
+
+from auto_rest import queries
+from auto_rest.handlers import create_list_records_handler, create_post_record_handler
+
+
+class TestCreatePostRecordHandler(TestCase):
+    """Unit tests for the `create_post_record_handler` function."""
+
+    def setUp(self) -> None:
+        """Set up a populated database table, FastAPI app, and test client."""
+
+        self.engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        self.table = Table("users", MetaData(), Column("id", Integer, primary_key=True), Column("name", String))
+        self.table.metadata.create_all(self.engine)
+        with self.engine.begin() as connection:
+            connection.execute(insert(self.table), [{"id": 1, "name": "alice"}])
+
+        app = FastAPI()
+        app.add_api_route("/", create_list_records_handler(self.engine, self.table))
+        app.add_api_route("/", create_post_record_handler(self.engine, self.table), methods=["POST"], status_code=201)
+        self.client = TestClient(app)
+
+    def tearDown(self) -> None:
+        """Clear any cached record counts."""
+
+        queries._count_cache.clear()
+
+    def get_names(self) -> dict[int, str]:
+        """Return a mapping of record IDs to names from the database."""
+
+        with self.engine.connect() as connection:
+            return dict(connection.execute(select(self.table.c.id, self.table.c.name)).all())
+
+    def test_create_record(self) -> None:
+        """Verify a new record is inserted into the database."""
+
+        response = self.client.post("/", json={"id": 2, "name": "bob"})
+        self.assertEqual(201, response.status_code)
+        self.assertEqual({1: "alice", 2: "bob"}, self.get_names())
+
+    def test_cached_count_cleared(self) -> None:
+        """Verify cached record counts are refreshed after a record is created."""
+
+        with patch.object(queries, "COUNT_CACHE_THRESHOLD", 0):
+            self.assertEqual("1", self.client.get("/").headers["x-pagination-total"])
+            self.client.post("/", json={"id": 2, "name": "bob"})
+            self.assertEqual("2", self.client.get("/").headers["x-pagination-total"])
+
+    def test_invalid_record(self) -> None:
+        """Verify invalid request bodies are rejected without inserting a record."""
+
+        response = self.client.post("/", json={"id": "not-an-int", "name": "bob"})
+        self.assertEqual(422, response.status_code)
+        self.assertEqual({1: "alice"}, self.get_names())
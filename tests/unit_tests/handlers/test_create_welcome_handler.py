@@ -23,3 +23,9 @@ class TestCreateWelcomeHandler(TestCase):
         response = self.client.get("/")
         self.assertEqual(200, response.status_code)
         self.assertEqual({"message": "Welcome to Auto-Rest!"}, response.json())
+
+    def test_handler_content_type(self) -> None:
+        """Verify the precomputed response is returned as JSON."""
+
+        response = self.client.get("/")
+        self.assertEqual("application/json", response.headers["content-type"])
@@ -1,8 +1,9 @@
+from decimal import Decimal
 from typing import Any
 from unittest import TestCase
 from unittest.mock import MagicMock, PropertyMock
 
-from sqlalchemy import Column, String
+from sqlalchemy import Column, Numeric, String
 
 from auto_rest.interfaces import create_field_definition
 
@@ -91,3 +92,9 @@ class TestCreateField(TestCase):
         type(mock_col.type).python_type = PropertyMock(side_effect=NotImplementedError)
 
         self.assertEqual((Any, ...), create_field_definition(mock_col))
+
+    def test_unmapped_column_type(self) -> None:
+        """Verify column types without a static mapping fall back to the driver provided type."""
+
+        self.assertEqual((Decimal, ...), create_field_definition(Column("num_col", Numeric, nullable=False)))
+        self.assertEqual((float, ...), create_field_definition(Column("num_col", Numeric(asdecimal=False), nullable=False)))
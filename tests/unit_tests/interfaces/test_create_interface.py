@@ -81,3 +81,23 @@ class TestCreateInterface(unittest.TestCase):
         self.assertCountEqual(["id1", "id2"], interface.model_fields.keys())
         self.assertEqual(interface.__annotations__["id1"], int)
         self.assertEqual(interface.__annotations__["id2"], int)
+
+    def test_interface_is_reused(self) -> None:
+        """Verify repeated calls with the same arguments return the same interface."""
+
+        self.assertIs(create_interface(self.table), create_interface(self.table))
+        self.assertIsNot(create_interface(self.table), create_interface(self.table, mode="optional"))
+
+    def test_interface_reused_across_calling_styles(self) -> None:
+        """Verify positional and keyword arguments share the same cached interface."""
+
+        interface = create_interface(self.table, pk_only=True, mode="required")
+        self.assertIs(interface, create_interface(self.table, True, "required"))
+        self.assertIs(interface, create_interface(self.table, mode="required", pk_only=True))
+
+    def test_cache_clear(self) -> None:
+        """Verify clearing the cache releases previously created interfaces."""
+
+        interface = create_interface(self.table)
+        create_interface.cache_clear()
+        self.assertIsNot(interface, create_interface(self.table))
@@ -3,8 +3,9 @@ from unittest import TestCase
 from sqlalchemy import URL
 from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
-from auto_rest.models import create_db_engine
+from auto_rest.models import create_db_engine, DRIVER_POOL_DEFAULTS, POOL_DEFAULTS, QUERY_CACHE_SIZE
 
 
 class TestCreateDbEngine(TestCase):
@@ -30,6 +31,51 @@ class TestCreateDbEngine(TestCase):
         self.assertEqual("aiosqlite", async_engine.driver)
         self.assertEqual(url, async_engine.url)
 
+    def test_pool_defaults(self) -> None:
+        """Verify server based databases use the default pool settings."""
+
+        url = URL.create(drivername="postgresql+asyncpg", host="localhost", database="default")
+        pool = create_db_engine(url).sync_engine.pool
+
+        self.assertEqual(POOL_DEFAULTS["pool_size"], pool.size())
+        self.assertEqual(POOL_DEFAULTS["pool_timeout"], pool.timeout())
+
+    def test_driver_pool_defaults(self) -> None:
+        """Verify driver specific pool settings take precedence over the general defaults."""
+
+        url = URL.create(drivername="postgresql+asyncpg", host="localhost", database="default")
+        pool = create_db_engine(url).sync_engine.pool
+
+        self.assertFalse(pool._pre_ping)
+        self.assertEqual(DRIVER_POOL_DEFAULTS["asyncpg"]["pool_recycle"], pool._recycle)
+
+    def test_pool_overrides(self) -> None:
+        """Verify keyword arguments override the default pool settings."""
+
+        url = URL.create(drivername="postgresql+asyncpg", host="localhost", database="default")
+        pool = create_db_engine(url, pool_size=2).sync_engine.pool
+        self.assertEqual(2, pool.size())
+
+    def test_async_pool_class(self) -> None:
+        """Verify async server based databases use an async compatible queue pool."""
+
+        url = URL.create(drivername="postgresql+asyncpg", host="localhost", database="default")
+        self.assertIsInstance(create_db_engine(url).pool, AsyncAdaptedQueuePool)
+
+    def test_pool_class_override(self) -> None:
+        """Verify an explicit pool class is used without the default pool settings."""
+
+        url = URL.create(drivername="postgresql+asyncpg", host="localhost", database="default")
+        engine = create_db_engine(url, poolclass=NullPool)
+        self.assertIsInstance(engine.pool, NullPool)
+
+    def test_query_cache_size(self) -> None:
+        """Verify the compiled statement cache uses the default size unless overridden."""
+
+        url = URL.create(drivername="sqlite", database=":memory:")
+        self.assertEqual(QUERY_CACHE_SIZE, create_db_engine(url)._compiled_cache.capacity)
+        self.assertEqual(10, create_db_engine(url, query_cache_size=10)._compiled_cache.capacity)
+
     def test_invalid_url(self) -> None:
         """Verify invalid database URLs raise an error."""
 
@@ -1,4 +1,7 @@
 import asyncio
+import pickle
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 
 from sqlalchemy import Column, create_engine, INTEGER, MetaData, Table
@@ -56,6 +59,104 @@ class TestCreateDbMetadata(TestCase):
 
         engine.dispose()
 
+    def test_synchronous_metadata_only(self) -> None:
+        """Verify only the requested tables are mapped using a synchronous engine."""
+
+        engine = create_engine("sqlite:///:memory:")
+        self.add_tables(engine)
+
+        metadata = create_db_metadata(engine, only=["test_table1"])
+        self.assertEqual(["test_table1"], list(metadata.tables))
+
+        engine.dispose()
+
+    def test_cached_metadata(self) -> None:
+        """Verify metadata is written to and reloaded from the cache directory."""
+
+        engine = create_engine("sqlite:///:memory:")
+        self.add_tables(engine)
+
+        with TemporaryDirectory() as cache_dir:
+            metadata = create_db_metadata(engine, cache_dir=Path(cache_dir))
+            self.assertEqual(1, len(list(Path(cache_dir).iterdir())))
+
+            # Schema changes are not visible once the metadata is cached
+            metadata.drop_all(engine)
+            cached_metadata = create_db_metadata(engine, cache_dir=Path(cache_dir))
+            self.assertCountEqual(metadata.tables, cached_metadata.tables)
+
+            # Different table selections are cached separately
+            self.assertEqual(0, len(create_db_metadata(engine, only=[], cache_dir=Path(cache_dir)).tables))
+
+        engine.dispose()
+
+    def test_corrupt_cached_metadata(self) -> None:
+        """Verify truncated cache files are ignored and replaced with reflected metadata."""
+
+        engine = create_engine("sqlite:///:memory:")
+        self.add_tables(engine)
+
+        with TemporaryDirectory() as cache_dir:
+            create_db_metadata(engine, cache_dir=Path(cache_dir))
+            cache_file = next(Path(cache_dir).iterdir())
+            cache_file.write_bytes(cache_file.read_bytes()[:10])
+
+            with self.assertLogs("auto_rest", level="WARNING"):
+                metadata = create_db_metadata(engine, cache_dir=Path(cache_dir))
+
+            self.assertEqual(2, len(metadata.tables))
+            self.assertEqual([cache_file], list(Path(cache_dir).iterdir()))
+            self.assertEqual(2, len(create_db_metadata(engine, cache_dir=Path(cache_dir)).tables))
+
+        engine.dispose()
+
+    def test_invalid_cached_metadata(self) -> None:
+        """Verify cache files containing objects other than metadata are replaced."""
+
+        engine = create_engine("sqlite:///:memory:")
+        self.add_tables(engine)
+
+        with TemporaryDirectory() as cache_dir:
+            create_db_metadata(engine, cache_dir=Path(cache_dir))
+            cache_file = next(Path(cache_dir).iterdir())
+            cache_file.write_bytes(pickle.dumps("junk"))
+
+            with self.assertLogs("auto_rest", level="WARNING"):
+                metadata = create_db_metadata(engine, cache_dir=Path(cache_dir))
+
+            self.assertEqual(2, len(metadata.tables))
+            self.assertIsInstance(pickle.loads(cache_file.read_bytes()), MetaData)
+
+        engine.dispose()
+
+    def test_cached_metadata_table_order(self) -> None:
+        """Verify table selections in different orders share a cache file."""
+
+        engine = create_engine("sqlite:///:memory:")
+        self.add_tables(engine)
+
+        with TemporaryDirectory() as cache_dir:
+            create_db_metadata(engine, only=["test_table1", "test_table2"], cache_dir=Path(cache_dir))
+            create_db_metadata(engine, only=["test_table2", "test_table1"], cache_dir=Path(cache_dir))
+            self.assertEqual(1, len(list(Path(cache_dir).iterdir())))
+
+        engine.dispose()
+
+    def test_expired_cached_metadata(self) -> None:
+        """Verify cached metadata is reflected again once expired."""
+
+        engine = create_engine("sqlite:///:memory:")
+        self.add_tables(engine)
+
+        with TemporaryDirectory() as cache_dir:
+            metadata = create_db_metadata(engine, cache_dir=Path(cache_dir))
+            metadata.drop_all(engine)
+
+            self.assertEqual(2, len(create_db_metadata(engine, cache_dir=Path(cache_dir), cache_ttl=60).tables))
+            self.assertEqual(0, len(create_db_metadata(engine, cache_dir=Path(cache_dir), cache_ttl=0).tables))
+
+        engine.dispose()
+
     def test_asynchronous_metadata(self) -> None:
         """Verify tables are mapped using an asynchronous engine."""
 
@@ -78,3 +179,40 @@ class TestCreateDbMetadata(TestCase):
         self.assertEqual(0, len(metadata.tables))
 
         asyncio.run(async_engine.dispose())
+
+    def test_asynchronous_metadata_only(self) -> None:
+        """Verify only the requested tables are mapped using an asynchronous engine."""
+
+        async_engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        self.add_tables(async_engine)
+
+        metadata = create_db_metadata(async_engine, only=["test_table2"])
+        self.assertEqual(["test_table2"], list(metadata.tables))
+
+        asyncio.run(async_engine.dispose())
+
+    def test_asynchronous_pool_released(self) -> None:
+        """Verify connections opened during async reflection are not left in the connection pool."""
+
+        with TemporaryDirectory() as tmp_dir:
+            async_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_dir}/test.db")
+            self.add_tables(async_engine)
+
+            create_db_metadata(async_engine)
+            self.assertEqual(0, async_engine.pool.checkedin())
+
+            asyncio.run(async_engine.dispose())
+
+    def test_asynchronous_metadata_running_loop(self) -> None:
+        """Verify tables are mapped using an asynchronous engine from within a running event loop."""
+
+        async_engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        self.add_tables(async_engine)
+
+        async def reflect() -> MetaData:
+            return create_db_metadata(async_engine)
+
+        metadata = asyncio.run(reflect())
+        self.assertEqual(2, len(metadata.tables))
+
+        asyncio.run(async_engine.dispose())
@@ -18,6 +18,22 @@ class TestCreateSessionIterator(IsolatedAsyncioTestCase):
         cls.test_engine = create_engine("sqlite:///:memory:")
         cls.test_async_engine = create_async_engine("sqlite+aiosqlite:///:memory:")
 
+    def test_iterator_is_reused(self) -> None:
+        """Verify repeated calls with the same engine return the same function."""
+
+        self.assertIs(create_session_iterator(self.test_engine), create_session_iterator(self.test_engine))
+        self.assertIs(create_session_iterator(self.test_async_engine), create_session_iterator(self.test_async_engine))
+
+    def test_iterator_is_not_evicted(self) -> None:
+        """Verify cached functions are retained when many engines are in use."""
+
+        session_iterator = create_session_iterator(self.test_engine)
+        other_engines = [create_engine("sqlite:///:memory:") for _ in range(10)]
+        for engine in other_engines:
+            create_session_iterator(engine)
+
+        self.assertIs(session_iterator, create_session_iterator(self.test_engine))
+
     def test_session_is_active(self) -> None:
         """Verify the generated function yields an active session."""
 
@@ -27,6 +43,7 @@ class TestCreateSessionIterator(IsolatedAsyncioTestCase):
         with next(session_generator) as session:
             self.assertIsInstance(session, Session)
             self.assertTrue(session.is_active)
+            self.assertFalse(session.autoflush)
             self.assertIs(self.test_engine, session.bind)
 
     def test_session_closes_after_use(self) -> None:
@@ -50,6 +67,7 @@ class TestCreateSessionIterator(IsolatedAsyncioTestCase):
         async with await anext(session_generator) as session:
             self.assertIsInstance(session, AsyncSession)
             self.assertTrue(session.is_active)
+            self.assertFalse(session.sync_session.autoflush)
             self.assertIs(self.test_async_engine, session.bind)
 
     async def test_async_session_closes_after_use(self) -> None:
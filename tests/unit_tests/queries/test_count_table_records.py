@@ -0,0 +1,80 @@
+from tempfile import TemporaryDirectory
+from unittest.async_case import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+from sqlalchemy import Column, create_engine, insert, Integer, MetaData, Table
+from sqlalchemy.orm import Session
+
+from auto_rest import queries
+from auto_rest.queries import clear_table_count, count_table_records
+
+
+class TestCountTableRecords(IsolatedAsyncioTestCase):
+    """Unit tests for the `count_table_records` function."""
+
+    def setUp(self) -> None:
+        """Create a populated database table and an open session."""
+
+        self.engine = create_engine("sqlite:///:memory:")
+        self.table = Table("test_table", MetaData(), Column("id", Integer, primary_key=True))
+        self.table.metadata.create_all(self.engine)
+
+        self.session = Session(self.engine)
+        self.session.execute(insert(self.table), [{"id": i} for i in range(5)])
+
+    def tearDown(self) -> None:
+        """Close the session and clear any cached record counts."""
+
+        self.session.close()
+        self.engine.dispose()
+        queries._count_cache.clear()
+
+    async def test_returns_record_count(self) -> None:
+        """Verify the number of table records is returned."""
+
+        self.assertEqual(5, await count_table_records(self.session, self.table))
+
+    async def test_small_counts_are_not_cached(self) -> None:
+        """Verify counts below the caching threshold reflect new records."""
+
+        await count_table_records(self.session, self.table)
+        self.session.execute(insert(self.table), [{"id": 5}])
+        self.assertEqual(6, await count_table_records(self.session, self.table))
+
+    async def test_large_counts_are_cached(self) -> None:
+        """Verify counts above the caching threshold are reused."""
+
+        with patch.object(queries, "COUNT_CACHE_THRESHOLD", 5):
+            await count_table_records(self.session, self.table)
+            self.session.execute(insert(self.table), [{"id": 5}])
+            self.assertEqual(5, await count_table_records(self.session, self.table))
+
+    async def test_expired_counts_are_refreshed(self) -> None:
+        """Verify cached counts are discarded once expired."""
+
+        with patch.object(queries, "COUNT_CACHE_THRESHOLD", 5), patch.object(queries, "COUNT_CACHE_TTL", -1):
+            await count_table_records(self.session, self.table)
+            self.session.execute(insert(self.table), [{"id": 5}])
+            self.assertEqual(6, await count_table_records(self.session, self.table))
+
+    async def test_cleared_counts_are_refreshed(self) -> None:
+        """Verify cleared counts are queried again."""
+
+        with patch.object(queries, "COUNT_CACHE_THRESHOLD", 5):
+            await count_table_records(self.session, self.table)
+            self.session.execute(insert(self.table), [{"id": 5}])
+            clear_table_count(self.session, self.table)
+            self.assertEqual(6, await count_table_records(self.session, self.table))
+
+    async def test_counts_are_cached_per_database(self) -> None:
+        """Verify cached counts are not shared between databases with the same table."""
+
+        with TemporaryDirectory() as tmp_dir:
+            other_engine = create_engine(f"sqlite:///{tmp_dir}/other.db")
+            self.table.metadata.create_all(other_engine)
+
+            with patch.object(queries, "COUNT_CACHE_THRESHOLD", 0), Session(other_engine) as other_session:
+                await count_table_records(self.session, self.table)
+                self.assertEqual(0, await count_table_records(other_session, self.table))
+
+            other_engine.dispose()
@@ -1,9 +1,10 @@
 from unittest.async_case import IsolatedAsyncioTestCase
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from auto_rest import queries
 from auto_rest.queries import execute_session_query
 
 
@@ -11,11 +12,12 @@ class TestExecuteSessionQuery(IsolatedAsyncioTestCase):
     """Unit tests for the `execute_session_query` function."""
 
     @staticmethod
-    async def _test_session_execution(session_type: type[Session] | type[AsyncSession]) -> None:
+    async def _test_session_execution(session_type: type[Session] | type[AsyncSession], params: dict | None = None) -> None:
         """Helper method to test a session object calls the `execute` method.
 
         Args:
             session_type: The session type to be tested.
+            params: Optional bound parameter values to pass with the query.
         """
 
         # Create mock objects for the session and query
@@ -25,8 +27,8 @@ class TestExecuteSessionQuery(IsolatedAsyncioTestCase):
         mock_session.execute.return_value = mock_result
 
         # Verify execute() was called and returns the correct result
-        result = await execute_session_query(mock_session, mock_query)
-        mock_session.execute.assert_called_once_with(mock_query)
+        result = await execute_session_query(mock_session, mock_query, params)
+        mock_session.execute.assert_called_once_with(mock_query, params)
         assert result == mock_result
 
     async def test_execute_sync_session(self) -> None:
@@ -38,3 +40,18 @@ class TestExecuteSessionQuery(IsolatedAsyncioTestCase):
         """Verify queries are executed with an asynchronous session."""
 
         await self._test_session_execution(AsyncSession)
+
+    async def test_execute_with_params(self) -> None:
+        """Verify bound parameter values are forwarded to the session."""
+
+        await self._test_session_execution(Session, {"id": 1})
+        await self._test_session_execution(AsyncSession, {"id": 1})
+
+    async def test_query_not_compiled_without_debug_logging(self) -> None:
+        """Verify queries are only converted to strings when debug logging is enabled."""
+
+        mock_query = MagicMock()
+        with patch.object(queries.logger, "isEnabledFor", return_value=False):
+            await execute_session_query(MagicMock(spec=Session), mock_query)
+
+        mock_query.__str__.assert_not_called()
@@ -21,6 +21,13 @@ class TestGetRecordOr404(IsolatedAsyncioTestCase):
         result = get_record_or_404(mock_result)
         self.assertEqual(result, mock_record)
 
+    def test_get_falsy_record_found(self) -> None:
+        """Verify records are returned regardless of their truthiness."""
+
+        mock_result = MagicMock()
+        mock_result.fetchone.return_value = ()
+        self.assertEqual((), get_record_or_404(mock_result))
+
     def test_get_record_not_found(self) -> None:
         """Verify a 404 error is raised when no record is found."""
 
@@ -0,0 +1,30 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from fastapi import HTTPException, status
+
+from auto_rest.queries import get_rowcount_or_404
+
+
+class TestGetRowcountOr404(TestCase):
+    """Unit tests for the `get_rowcount_or_404` function."""
+
+    def test_get_rowcount_found(self) -> None:
+        """Verify the row count is returned when rows are matched."""
+
+        mock_result = MagicMock()
+        mock_result.rowcount = 2
+
+        self.assertEqual(2, get_rowcount_or_404(mock_result))
+
+    def test_get_rowcount_not_found(self) -> None:
+        """Verify a 404 error is raised when no rows are matched."""
+
+        mock_result = MagicMock()
+        mock_result.rowcount = 0
+
+        with self.assertRaises(HTTPException) as context:
+            get_rowcount_or_404(mock_result)
+
+        self.assertEqual(context.exception.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(context.exception.detail, "Record not found")
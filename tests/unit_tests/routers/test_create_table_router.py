@@ -1,6 +1,7 @@
 from unittest import TestCase
 from unittest.mock import MagicMock
 
+from fastapi.datastructures import DefaultPlaceholder
 from sqlalchemy import Column, Integer, MetaData, String, Table
 
 from auto_rest.routers import create_table_router
@@ -79,3 +80,10 @@ class TestCreateTableRouter(TestCase):
         ]
 
         self.assertCountEqual(expected_routes, actual_routes)
+
+    def test_default_response_class(self) -> None:
+        """Verify routes use the default response class for Pydantic based serialization."""
+
+        router = create_table_router(self.mock_engine, self.single_pk_table)
+        for route in router.routes:
+            self.assertIsInstance(route.response_class, DefaultPlaceholder)